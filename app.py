@@ -40,6 +40,7 @@ BTN_SUCCESS = "#00E676"
 BTN_DISCARD = "#EF9A9A"       # softer red, lower saturation
 TITLE_MAX_LEN = 80             # max characters for task title (input limit)
 TITLE_DISPLAY_LEN = 50        # max characters shown on card (keeps date/delete visible)
+TITLE_ANIM_MS = 420            # title banner pulse interval (paused while minimized/unfocused)
 
 # --- Emojis & column display names (use font Segoe UI Emoji for colorful emojis) ---
 COLUMN_EMOJI = {
@@ -63,6 +64,12 @@ TYPE_EMOJI = {
     "idea": "💡",
     "other": "📌",
 }
+COL_HEADERS = {
+    "envisioned": ("Title", "Date added"),
+    "in_progress": ("Title", "Last accessed"),
+    "discarded": ("Title", "Discarded"),
+    "completed": ("Title", "Completed"),
+}
 WINDOW_TITLE = "✨ Spark to Fire 🔥"
 ADD_SPARK_LABEL = "✨ Add Spark"
 
@@ -133,6 +140,14 @@ class SparkToFireApp(ctk.CTk):
         apply_decay(self.data)
         self._emoji_img_cache = {}  # (char, size) -> CTkImage, so colored emojis stay visible
         self._title_anim_frame = 0  # 0 or 1 for pulse
+        self._title_anim_job = None  # pending after() id for the banner pulse
+        self._title_anim_enabled = False
+        # Render scheduler: state changes mark columns dirty; one render per idle tick
+        self._dirty_columns = set()
+        self._footer_dirty = False
+        self._render_job = None
+        self._window_mapped = True
+        self._activity_job = None
 
         # Title banner centred: only the emojis animate (spark + fire pulse); text stays static
         title_outer = ctk.CTkFrame(self, fg_color="transparent")
@@ -156,7 +171,8 @@ class SparkToFireApp(ctk.CTk):
         self._title_fire_lbl = ctk.CTkLabel(fire_box, text="", image=self._fire_small or self._fire_big, fg_color="transparent")
         self._title_fire_lbl.place(relx=0.5, rely=0.5, anchor="center")
         if self._spark_small and self._spark_big and self._fire_small and self._fire_big:
-            self._animate_title_banner()
+            self._title_anim_enabled = True
+            self._resume_periodic()
 
         # Top bar
         top = ctk.CTkFrame(self, fg_color="transparent")
@@ -193,7 +209,7 @@ class SparkToFireApp(ctk.CTk):
             if img:
                 ctk.CTkLabel(title_row, text="", image=img, padx=0, pady=0).pack(side="left", padx=(0, 4))
             ctk.CTkLabel(title_row, text=COLUMN_DISPLAY.get(status, status), text_color=TEXT_COLOR, font=ctk.CTkFont(size=14, weight="bold"), padx=0, pady=0).pack(side="left")
-            # Row 1: scroll — "Title" / "Date added" header is added inside scroll in refresh_board (first child)
+            # Row 1: scroll — "Title" / "Date added" header is added inside scroll in _render_column (first child)
             scroll = ctk.CTkScrollableFrame(col_f, fg_color="transparent")
             scroll.grid(row=1, column=0, sticky="nsew", padx=4, pady=(0, 4))
             self.column_frames[status] = col_f
@@ -204,47 +220,62 @@ class SparkToFireApp(ctk.CTk):
         ctk.CTkLabel(self.footer, text="Collected fires: ", text_color=TEXT_COLOR, font=ctk.CTkFont(size=13)).pack(side="left")
         self.fires_imgs_frame = ctk.CTkFrame(self.footer, fg_color="transparent")
         self.fires_imgs_frame.pack(side="left")
+        # Pause animation while minimized or unfocused; defer renders while minimized
+        self.bind("<Map>", self._on_window_map, add="+")
+        self.bind("<Unmap>", self._on_window_unmap, add="+")
+        # bind_all: focus changes inside detail/Add Spark toplevels never reach the root's bindtags
+        self.bind_all("<FocusIn>", self._on_focus_change, add="+")
+        self.bind_all("<FocusOut>", self._on_focus_change, add="+")
         self.refresh_board()
 
     def refresh_board(self):
+        """Schedule a full redraw of every column and the footer."""
+        self.invalidate(*self.scroll_frames, footer=True)
+
+    def invalidate(self, *statuses, footer: bool = False):
+        """Mark columns dirty and coalesce redraws into one render on the next idle tick."""
+        self._dirty_columns.update(s for s in statuses if s in self.scroll_frames)
+        self._footer_dirty = self._footer_dirty or footer or "completed" in statuses
+        self._schedule_render()
+
+    def _schedule_render(self):
+        if self._render_job is not None or not self._window_mapped:
+            return
+        if self._dirty_columns or self._footer_dirty:
+            self._render_job = self.after_idle(self._flush_render)
+
+    def _flush_render(self):
+        self._render_job = None
+        if not self._window_mapped:
+            return  # keep dirty state; <Map> reschedules
+        dirty, self._dirty_columns = self._dirty_columns, set()
+        footer, self._footer_dirty = self._footer_dirty, False
         self.data = load_data()
-        COL_HEADERS = {
-            "envisioned": ("Title", "Date added"),
-            "in_progress": ("Title", "Last accessed"),
-            "discarded": ("Title", "Discarded"),
-            "completed": ("Title", "Completed"),
-        }
-        for status, scroll in self.scroll_frames.items():
-            for w in scroll.winfo_children():
-                w.destroy()
-            # First child: header row (Title left, date right); grid so no centering; no border
-            head_left, head_right = COL_HEADERS.get(status, ("Title", "Date"))
-            header_row = ctk.CTkFrame(scroll, fg_color="transparent", border_width=0, corner_radius=0)
-            header_row.pack(side="top", fill="x", pady=(0, 2))
-            header_row.grid_columnconfigure(0, weight=0)   # Title: natural width
-            header_row.grid_columnconfigure(1, weight=1)    # stretch middle
-            header_row.grid_columnconfigure(2, weight=0)   # date: natural width
-            lbl_title = ctk.CTkLabel(header_row, text=head_left, text_color=TEXT_COLOR, font=ctk.CTkFont(size=11, weight="bold"), padx=0, pady=0, anchor="w", fg_color="transparent")
-            lbl_title.grid(row=0, column=0, sticky="w", padx=(10, 8))
-            lbl_date = ctk.CTkLabel(header_row, text=head_right, text_color=TEXT_COLOR, font=ctk.CTkFont(size=11, weight="bold"), padx=0, pady=0, anchor="e", fg_color="transparent")
-            lbl_date.grid(row=0, column=2, sticky="e", padx=(8, 4))
-        completed_count = sum(1 for i in self.data.get("items", []) if i.get("status") == "completed")
-        for w in self.fires_imgs_frame.winfo_children():
+        for status in self.scroll_frames:
+            if status in dirty:
+                self._render_column(status)
+        if footer:
+            self._render_footer()
+
+    def _render_column(self, status: str):
+        scroll = self.scroll_frames[status]
+        for w in scroll.winfo_children():
             w.destroy()
-        fire_img = _emoji_image(self, "🔥", 20)
-        if fire_img and completed_count > 0:
-            for _ in range(completed_count):
-                ctk.CTkLabel(self.fires_imgs_frame, text="", image=fire_img).pack(side="left", padx=1)
-        elif not fire_img:
-            ctk.CTkLabel(self.fires_imgs_frame, text="🔥" * completed_count if completed_count else "—", text_color=TEXT_COLOR, font=ctk.CTkFont(size=14)).pack(side="left")
-        else:
-            ctk.CTkLabel(self.fires_imgs_frame, text="—", text_color=TEXT_COLOR, font=ctk.CTkFont(size=14)).pack(side="left")
+        # First child: header row (Title left, date right); grid so no centering; no border
+        head_left, head_right = COL_HEADERS.get(status, ("Title", "Date"))
+        header_row = ctk.CTkFrame(scroll, fg_color="transparent", border_width=0, corner_radius=0)
+        header_row.pack(side="top", fill="x", pady=(0, 2))
+        header_row.grid_columnconfigure(0, weight=0)   # Title: natural width
+        header_row.grid_columnconfigure(1, weight=1)    # stretch middle
+        header_row.grid_columnconfigure(2, weight=0)   # date: natural width
+        lbl_title = ctk.CTkLabel(header_row, text=head_left, text_color=TEXT_COLOR, font=ctk.CTkFont(size=11, weight="bold"), padx=0, pady=0, anchor="w", fg_color="transparent")
+        lbl_title.grid(row=0, column=0, sticky="w", padx=(10, 8))
+        lbl_date = ctk.CTkLabel(header_row, text=head_right, text_color=TEXT_COLOR, font=ctk.CTkFont(size=11, weight="bold"), padx=0, pady=0, anchor="e", fg_color="transparent")
+        lbl_date.grid(row=0, column=2, sticky="e", padx=(8, 4))
 
         for item in self.data.get("items", []):
-            status = item.get("status") or "envisioned"
-            if status not in self.scroll_frames:
+            if (item.get("status") or "envisioned") != status:
                 continue
-            scroll = self.scroll_frames[status]
             card = ctk.CTkFrame(scroll, fg_color=CARD_BG, corner_radius=6, border_width=1, border_color="#E0E0E0")
             card.pack(fill="x", pady=2, padx=2)
             # One line per card: title (expand) | type | date | delete
@@ -274,13 +305,32 @@ class SparkToFireApp(ctk.CTk):
             for child in type_frame.winfo_children():
                 child.bind("<Button-1>", lambda e, iid=item_id: self.on_card_click(iid))
 
+    def _render_footer(self):
+        completed_count = sum(1 for i in self.data.get("items", []) if i.get("status") == "completed")
+        for w in self.fires_imgs_frame.winfo_children():
+            w.destroy()
+        fire_img = _emoji_image(self, "🔥", 20)
+        if fire_img and completed_count > 0:
+            for _ in range(completed_count):
+                ctk.CTkLabel(self.fires_imgs_frame, text="", image=fire_img).pack(side="left", padx=1)
+        elif not fire_img:
+            ctk.CTkLabel(self.fires_imgs_frame, text="🔥" * completed_count if completed_count else "—", text_color=TEXT_COLOR, font=ctk.CTkFont(size=14)).pack(side="left")
+        else:
+            ctk.CTkLabel(self.fires_imgs_frame, text="—", text_color=TEXT_COLOR, font=ctk.CTkFont(size=14)).pack(side="left")
+
+    def _item_status(self, item_id: str) -> str:
+        item = next((i for i in self.data.get("items", []) if i.get("id") == item_id), None)
+        return (item or {}).get("status") or "envisioned"
+
     def on_card_click(self, item_id: str):
-        update_last_accessed(self.data, item_id)
+        if update_last_accessed(self.data, item_id):
+            self.invalidate("in_progress")
         self.open_detail_view(item_id)
 
     def on_delete_item(self, item_id: str):
+        status = self._item_status(item_id)
         delete_item(self.data, item_id)
-        self.refresh_board()
+        self.invalidate(status)
 
     def _animate_title_banner(self):
         """Pulse spark and fire emojis in the title banner (sparking / flaming effect)."""
@@ -294,7 +344,55 @@ class SparkToFireApp(ctk.CTk):
                 self._title_fire_lbl.configure(image=self._fire_big)
         except Exception:
             pass
-        self.after(420, self._animate_title_banner)
+        self._title_anim_job = self.after(TITLE_ANIM_MS, self._animate_title_banner)
+
+    def _on_window_map(self, event):
+        if event.widget is not self:
+            return
+        self._window_mapped = True
+        self._schedule_render()
+        self._on_focus_change(event)
+
+    def _on_window_unmap(self, event):
+        if event.widget is not self:
+            return
+        self._window_mapped = False
+        self._pause_periodic()
+
+    def _on_focus_change(self, event=None):
+        # Focus moves between child widgets fire In/Out pairs; settle once the queue is idle
+        if self._activity_job is None:
+            self._activity_job = self.after_idle(self._update_activity)
+
+    def _update_activity(self):
+        self._activity_job = None
+        try:
+            focused = self.focus_displayof() is not None
+        except Exception:
+            focused = True  # e.g. focus on a widget Tk can't resolve; treat as active
+        if self._window_mapped and focused:
+            self._resume_periodic()
+        else:
+            self._pause_periodic()
+
+    def _resume_periodic(self):
+        if self._title_anim_enabled and self._title_anim_job is None:
+            self._title_anim_job = self.after(TITLE_ANIM_MS, self._animate_title_banner)
+
+    def _pause_periodic(self):
+        if self._title_anim_job is not None:
+            self.after_cancel(self._title_anim_job)
+            self._title_anim_job = None
+
+    def destroy(self):
+        for job in (self._title_anim_job, self._render_job, self._activity_job):
+            if job is not None:
+                try:
+                    self.after_cancel(job)
+                except Exception:
+                    pass
+        self._title_anim_job = self._render_job = self._activity_job = None
+        super().destroy()
 
     def open_add_spark_modal(self):
         # Add Spark modal: everything in one line – title, type, Save, Cancel
@@ -327,7 +425,7 @@ class SparkToFireApp(ctk.CTk):
                 return
             create_item(self.data, title, get_type_key())
             modal.destroy()
-            self.refresh_board()
+            self.invalidate("envisioned")
         def on_cancel():
             modal.destroy()
         ctk.CTkButton(row, text="💾 Save", fg_color=BTN_PRIMARY, text_color=TEXT_COLOR, command=on_save).pack(side="left", padx=(0, 6))
@@ -401,13 +499,13 @@ class SparkToFireApp(ctk.CTk):
             notes_txt.bind("<KeyRelease>", lambda e: _resize_textbox(notes_txt))
             def save_completed():
                 update_item(self.data, item_id, takeaways=takeaways_txt.get("1.0", "end").strip(), learning_notes=notes_txt.get("1.0", "end").strip())
-                top.destroy()
-                self.refresh_board()
+                top.destroy()  # takeaways/notes aren't shown on the card or footer; no redraw needed
             ctk.CTkButton(actions, text="💾 Save", fg_color=BTN_PRIMARY, text_color=TEXT_COLOR, command=save_completed).pack(side="left")
 
         ctk.CTkButton(f, text="Close", fg_color="gray75", text_color=TEXT_COLOR, command=top.destroy).pack(anchor="w", pady=(8, 0))
 
     def _detail_done(self, toplevel, item_id: str, target: str):
+        source = self._item_status(item_id)
         if target == "completed":
             move_to_completed(self.data, item_id)
         elif target == "discarded":
@@ -415,12 +513,13 @@ class SparkToFireApp(ctk.CTk):
         elif target == "in_progress":
             move_to_in_progress(self.data, item_id)
         toplevel.destroy()
-        self.refresh_board()
+        self.invalidate(source, target)
 
     def _detail_delete(self, toplevel, item_id: str):
+        status = self._item_status(item_id)
         delete_item(self.data, item_id)
         toplevel.destroy()
-        self.refresh_board()
+        self.invalidate(status)
 
 
 def main():